@@ -45,11 +45,30 @@ async def async_setup(hass, config):
     access_token = config[DOMAIN][CONF_ACCESS_TOKEN]
     session = async_get_clientsession(hass)
     api = NatureRemoAPI(access_token, session)
+
+    async def async_update_data():
+        """Fetch data and index smart meter properties by EPC."""
+        data = await api.get()
+        # skip malformed meters rather than failing the whole refresh
+        data["epc_by_appliance"] = {
+            appliance_id: {
+                value["epc"]: value["val"]
+                for value in (appliance.get("smart_meter") or {}).get(
+                    "echonetlite_properties"
+                )
+                or []
+                if "epc" in value and "val" in value
+            }
+            for appliance_id, appliance in data["appliances"].items()
+            if appliance.get("type") == "EL_SMART_METER"
+        }
+        return data
+
     coordinator = hass.data[DOMAIN] = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name="Nature Remo update",
-        update_method=api.get,
+        update_method=async_update_data,
         update_interval=DEFAULT_UPDATE_INTERVAL,
     )
     await coordinator.async_refresh()
@@ -70,31 +89,38 @@ class NatureRemoAPI:
     def __init__(self, access_token, session):
         """Init API client"""
         self._access_token = access_token
+        # shared Home Assistant session, so keep-alive connections are pooled
+        # across calls as long as every response is released back to it
         self._session = session
+        self._headers = {"Authorization": f"Bearer {access_token}"}
 
     async def get(self):
         """Get appliance and device list"""
         _LOGGER.debug("Trying to fetch appliance and device list from API.")
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        response = await self._session.get(f"{_RESOURCE}/appliances", headers=headers)
-        appliances = {x["id"]: x for x in await response.json()}
-        response = await self._session.get(f"{_RESOURCE}/devices", headers=headers)
-        devices = {x["id"]: x for x in await response.json()}
+        async with self._session.get(
+            f"{_RESOURCE}/appliances", headers=self._headers
+        ) as response:
+            appliances = {x["id"]: x for x in await response.json()}
+        async with self._session.get(
+            f"{_RESOURCE}/devices", headers=self._headers
+        ) as response:
+            devices = {x["id"]: x for x in await response.json()}
         return {"appliances": appliances, "devices": devices}
 
     async def post(self, path, data):
         """Post any request"""
         _LOGGER.debug("Trying to request post:%s, data:%s", path, data)
-        headers = {"Authorization": f"Bearer {self._access_token}"}
-        response = await self._session.post(
-            f"{_RESOURCE}{path}", data=data, headers=headers
-        )
-        return await response.json()
+        async with self._session.post(
+            f"{_RESOURCE}{path}", data=data, headers=self._headers
+        ) as response:
+            return await response.json()
 
 
 class NatureRemoBase(Entity):
     """Nature Remo entity base class."""
 
+    __slots__ = ("_coordinator", "_name", "_appliance_id", "_device")
+
     def __init__(self, coordinator, appliance):
         self._coordinator = coordinator
         self._name = f"Nature Remo {appliance['nickname']}"
@@ -131,6 +157,8 @@ class NatureRemoBase(Entity):
 class NatureRemoDeviceBase(Entity):
     """Nature Remo Device entity base class."""
 
+    __slots__ = ("_coordinator", "_name", "_device")
+
     def __init__(self, coordinator, device):
         self._coordinator = coordinator
         self._name = f"Nature Remo {device['name']}"
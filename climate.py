@@ -1,8 +1,10 @@
 """Support for Nature Remo AC."""
+import asyncio
 import logging
 
 from homeassistant.components.climate import ClimateEntity
-from homeassistant.components.climate.const import (ClimateEntityFeature,
+from homeassistant.components.climate.const import (ATTR_HVAC_MODE,
+                                                    ClimateEntityFeature,
                                                     HVACMode)
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import callback
@@ -13,6 +15,9 @@ _LOGGER = logging.getLogger(__name__)
 
 SUPPORT_FLAGS = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.SWING_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
 
+# seconds to wait for further changes before sending settings to the API
+DEBOUNCE_DELAY = 0.4
+
 MODE_HA_TO_REMO = {
     HVACMode.AUTO: "auto",
     HVACMode.FAN_ONLY: "blow",
@@ -22,6 +27,8 @@ MODE_HA_TO_REMO = {
     HVACMode.OFF: "power-off",
 }
 
+_REMO_OFF = MODE_HA_TO_REMO[HVACMode.OFF]
+
 MODE_REMO_TO_HA = {
     "auto": HVACMode.AUTO,
     "blow": HVACMode.FAN_ONLY,
@@ -31,6 +38,9 @@ MODE_REMO_TO_HA = {
     "power-off": HVACMode.OFF,
 }
 
+# last target temperature per Remo mode, copied for each AC
+_EMPTY_LAST_TEMPS = dict.fromkeys(MODE_REMO_TO_HA)
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Nature Remo AC."""
@@ -50,10 +60,44 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     )
 
 
+def _temp_range(temps):
+    """Return (min, max, step) of the temperatures supported by a mode."""
+    temp_range = [float(temp) for temp in temps if temp]
+    if len(temp_range) == 0:
+        return 0, 0, 1
+    step = 1
+    if len(temp_range) >= 2:
+        # determine step from the gap of first and second temperature
+        gap = round(temp_range[1] - temp_range[0], 1)
+        if gap in [1.0, 0.5]:  # valid steps
+            step = gap
+    return min(temp_range), max(temp_range), step
+
+
 class NatureRemoAC(NatureRemoBase, ClimateEntity):
     """Implementation of a Nature Remo E sensor."""
     _enable_turn_on_off_backwards_compatibility = False
 
+    __slots__ = (
+        "_api",
+        "_default_temp",
+        "_modes",
+        "_mode_ranges",
+        "_hvac_modes",
+        "_hvac_mode",
+        "_current_temperature",
+        "_target_temperature",
+        "_remo_mode",
+        "_fan_mode",
+        "_swing_mode",
+        "_last_target_temperature",
+        "_pending_data",
+        "_inflight_data",
+        "_pending_mode_temperature",
+        "_pending_task",
+        "_post_lock",
+    )
+
     def __init__(self, coordinator, api, appliance, config):
         super().__init__(coordinator, appliance)
         self._api = api
@@ -62,13 +106,26 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
             HVACMode.HEAT: config[CONF_HEAT_TEMP],
         }
         self._modes = appliance["aircon"]["range"]["modes"]
+        self._mode_ranges = {
+            mode: _temp_range(spec["temp"]) for mode, spec in self._modes.items()
+        }
+        self._hvac_modes = tuple(MODE_REMO_TO_HA[mode] for mode in self._modes) + (
+            HVACMode.OFF,
+        )
         self._hvac_mode = None
         self._current_temperature = None
         self._target_temperature = None
         self._remo_mode = None
         self._fan_mode = None
         self._swing_mode = None
-        self._last_target_temperature = {v: None for v in MODE_REMO_TO_HA}
+        self._last_target_temperature = _EMPTY_LAST_TEMPS.copy()
+        self._pending_data = {}
+        # settings of the request currently being sent
+        self._inflight_data = {}
+        # whether the pending temperature was added by a mode change
+        self._pending_mode_temperature = False
+        self._pending_task = None
+        self._post_lock = asyncio.Lock()
         self._update(appliance["settings"])
 
     @property
@@ -89,35 +146,22 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
     @property
     def min_temp(self):
         """Return the minimum temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) == 0:
-            return 0
-        return min(temp_range)
+        return self._mode_ranges[self._remo_mode][0]
 
     @property
     def max_temp(self):
         """Return the maximum temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) == 0:
-            return 0
-        return max(temp_range)
+        return self._mode_ranges[self._remo_mode][1]
 
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        _LOGGER.debug("Current target temperature: %s", self._target_temperature)
         return self._target_temperature
 
     @property
     def target_temperature_step(self):
         """Return the supported step of target temperature."""
-        temp_range = self._current_mode_temp_range()
-        if len(temp_range) >= 2:
-            # determine step from the gap of first and second temperature
-            step = round(temp_range[1] - temp_range[0], 1)
-            if step in [1.0, 0.5]:  # valid steps
-                return step
-        return 1
+        return self._mode_ranges[self._remo_mode][2]
 
     @property
     def hvac_mode(self):
@@ -127,10 +171,7 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
     @property
     def hvac_modes(self):
         """Return the list of available operation modes."""
-        remo_modes = list(self._modes.keys())
-        ha_modes = list(map(lambda mode: MODE_REMO_TO_HA[mode], remo_modes))
-        ha_modes.append(HVACMode.OFF)
-        return ha_modes
+        return self._hvac_modes
 
     @property
     def fan_mode(self):
@@ -177,35 +218,84 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         target_temp = kwargs.get(ATTR_TEMPERATURE)
         if target_temp is None:
             return
-        if target_temp.is_integer():
-            # has to cast to whole number otherwise API will return an error
-            target_temp = int(target_temp)
-        _LOGGER.debug("Set temperature: %d", target_temp)
-        await self._post({"temperature": f"{target_temp}"})
+        _LOGGER.debug("Set temperature: %s", target_temp)
+        await self.async_apply(
+            hvac_mode=kwargs.get(ATTR_HVAC_MODE), temperature=target_temp
+        )
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
         _LOGGER.debug("Set hvac mode: %s", hvac_mode)
-        mode = MODE_HA_TO_REMO[hvac_mode]
-        if mode == MODE_HA_TO_REMO[HVACMode.OFF]:
-            await self._post({"button": mode})
-        else:
-            data = {"operation_mode": mode}
-            if self._last_target_temperature[mode]:
-                data["temperature"] = self._last_target_temperature[mode]
-            elif self._default_temp.get(hvac_mode):
-                data["temperature"] = self._default_temp[hvac_mode]
-            await self._post(data)
+        await self.async_apply(hvac_mode=hvac_mode)
 
     async def async_set_fan_mode(self, fan_mode):
         """Set new target fan mode."""
         _LOGGER.debug("Set fan mode: %s", fan_mode)
-        await self._post({"air_volume": fan_mode})
+        await self.async_apply(fan_mode=fan_mode)
 
     async def async_set_swing_mode(self, swing_mode):
         """Set new target swing operation."""
         _LOGGER.debug("Set swing mode: %s", swing_mode)
-        await self._post({"air_direction": swing_mode})
+        await self.async_apply(swing_mode=swing_mode)
+
+    async def async_apply(
+        self, *, hvac_mode=None, temperature=None, fan_mode=None, swing_mode=None
+    ):
+        """Queue settings to be sent to the API in a single request."""
+        pending = self._pending_data
+        data = {}
+        if hvac_mode is not None:
+            # the latest mode replaces any mode change still waiting,
+            # including the temperature that came with it
+            pending.pop("button", None)
+            pending.pop("operation_mode", None)
+            if self._pending_mode_temperature:
+                pending.pop("temperature", None)
+                self._pending_mode_temperature = False
+            if hvac_mode != self._expected_hvac_mode():
+                mode = MODE_HA_TO_REMO[hvac_mode]
+                if mode == _REMO_OFF:
+                    data["button"] = mode
+                else:
+                    data["operation_mode"] = mode
+                    if self._last_target_temperature[mode]:
+                        data["temperature"] = self._last_target_temperature[mode]
+                    elif self._default_temp.get(hvac_mode):
+                        data["temperature"] = self._default_temp[hvac_mode]
+                    self._pending_mode_temperature = "temperature" in data
+        if temperature is not None:
+            mode = data.get(
+                "operation_mode",
+                pending.get(
+                    "operation_mode",
+                    self._inflight_data.get("operation_mode", self._remo_mode),
+                ),
+            )
+            if self._mode_ranges[mode][2] == 1:
+                # has to be a whole number otherwise API will return an error
+                if not temperature.is_integer():
+                    _LOGGER.warning(
+                        "%s only supports whole degrees, setting %s instead of %s",
+                        self._name,
+                        int(temperature),
+                        temperature,
+                    )
+                data["temperature"] = f"{int(temperature)}"
+            else:
+                data["temperature"] = f"{temperature:g}"
+            self._pending_mode_temperature = False
+        if fan_mode is not None:
+            pending.pop("air_volume", None)
+            if fan_mode != self._inflight_data.get("air_volume", self._fan_mode):
+                data["air_volume"] = fan_mode
+        if swing_mode is not None:
+            pending.pop("air_direction", None)
+            if swing_mode != self._inflight_data.get(
+                "air_direction", self._swing_mode
+            ):
+                data["air_direction"] = swing_mode
+        if data:
+            self._post_debounced(data)
 
     async def async_added_to_hass(self):
         """Subscribe to updates."""
@@ -213,6 +303,12 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
             self._coordinator.async_add_listener(self._update_callback)
         )
 
+    async def async_will_remove_from_hass(self):
+        """Cancel pending settings."""
+        if self._pending_task is not None:
+            self._pending_task.cancel()
+            self._pending_task = None
+
     async def async_update(self):
         """Update the entity.
 
@@ -221,46 +317,102 @@ class NatureRemoAC(NatureRemoBase, ClimateEntity):
         await self._coordinator.async_request_refresh()
 
     def _update(self, ac_settings, device=None):
-        # hold this to determin the ac mode while it's turned-off
-        self._remo_mode = ac_settings["mode"]
-        try:
-            self._target_temperature = float(ac_settings["temp"])
-            self._last_target_temperature[self._remo_mode] = ac_settings["temp"]
-        except:
-            self._target_temperature = None
-
-        if ac_settings["button"] == MODE_HA_TO_REMO[HVACMode.OFF]:
-            self._hvac_mode = HVACMode.OFF
-        else:
-            self._hvac_mode = MODE_REMO_TO_HA[self._remo_mode]
+        """Apply AC settings and return a snapshot of the exposed state."""
+        get = ac_settings.get
+        mode = ac_settings["mode"]
+        temp = get("temp")
+        button = get("button")
+        vol = get("vol")
+        dir_ = get("dir")
+
+        target_temperature = None
+        if temp:
+            # temp is an empty string for modes without a target temperature
+            try:
+                target_temperature = float(temp)
+                self._last_target_temperature[mode] = temp
+            except ValueError:
+                pass
 
-        self._fan_mode = ac_settings["vol"] or None
-        self._swing_mode = ac_settings["dir"] or None
+        # hold this to determin the ac mode while it's turned-off
+        self._remo_mode = mode
+        self._hvac_mode = HVACMode.OFF if button == _REMO_OFF else MODE_REMO_TO_HA[mode]
+        self._target_temperature = target_temperature
+        self._fan_mode = vol or None
+        self._swing_mode = dir_ or None
 
         if device is not None:
-            # Wrap temperature sensor data access with try-except
             try:
-                if "newest_events" in device and "te" in device["newest_events"]:
-                    self._current_temperature = float(device["newest_events"]["te"]["val"])
+                self._current_temperature = float(device["newest_events"]["te"]["val"])
             except (KeyError, ValueError, TypeError):
                 # Skip temperature update if data is not available
-                _LOGGER.debug("Temperature data not available for device %s", self._device["id"])
+                pass
+
+        return self._state_snapshot()
+
+    def _state_snapshot(self):
+        # everything exposed through the entity properties
+        return (
+            self._remo_mode,
+            self._hvac_mode,
+            self._target_temperature,
+            self._fan_mode,
+            self._swing_mode,
+            self._current_temperature,
+        )
 
     @callback
     def _update_callback(self):
-        self._update(
+        before = self._state_snapshot()
+        after = self._update(
             self._coordinator.data["appliances"][self._appliance_id]["settings"],
             self._coordinator.data["devices"][self._device["id"]],
         )
-        self.async_write_ha_state()
+        if after != before:
+            self.async_write_ha_state()
 
     async def _post(self, data):
         response = await self._api.post(
             f"/appliances/{self._appliance_id}/aircon_settings", data
         )
-        self._update(response)
-        self.async_write_ha_state()
+        before = self._state_snapshot()
+        if self._update(response) != before:
+            self.async_write_ha_state()
+
+    def _post_debounced(self, data):
+        # coalesce rapid changes (e.g. slider drags, scenes) into a single request
+        self._pending_data.update(data)
+        if self._pending_task is not None:
+            self._pending_task.cancel()
+        self._pending_task = self.hass.async_create_task(
+            self._flush_pending(DEBOUNCE_DELAY)
+        )
 
-    def _current_mode_temp_range(self):
-        temp_range = self._modes[self._remo_mode]["temp"]
-        return list(map(float, filter(None, temp_range)))
+    async def _flush_pending(self, delay):
+        await asyncio.sleep(delay)
+        # detach before posting so a new change doesn't cancel the request
+        self._pending_task = None
+        # one request at a time, so responses are applied in order; changes
+        # made meanwhile are collected and sent once the previous one is done
+        async with self._post_lock:
+            data, self._pending_data = self._pending_data, {}
+            self._pending_mode_temperature = False
+            if not data:
+                return
+            self._inflight_data = data
+            try:
+                await self._post(data)
+            except Exception:  # pylint: disable=broad-except
+                # nobody awaits this task, so report the failure here
+                _LOGGER.exception("Failed to send settings %s to %s", data, self._name)
+            finally:
+                self._inflight_data = {}
+
+    def _expected_hvac_mode(self):
+        # mode the AC will be in once the request being sent is applied
+        inflight = self._inflight_data
+        if inflight.get("button") == _REMO_OFF:
+            return HVACMode.OFF
+        if "operation_mode" in inflight:
+            return MODE_REMO_TO_HA[inflight["operation_mode"]]
+        return self._hvac_mode
@@ -10,6 +10,13 @@ from . import DOMAIN, NatureRemoBase, NatureRemoDeviceBase
 
 _LOGGER = logging.getLogger(__name__)
 
+# newest_events key: (name suffix, device class, unit, unique id suffix)
+SENSOR_TYPES = {
+    "te": ("Temperature", SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, ""),
+    "hu": ("Humidity", SensorDeviceClass.HUMIDITY, None, ""),
+    "il": ("Illuminance", SensorDeviceClass.ILLUMINANCE, None, "-illuminance"),
+}
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Nature Remo E sensor."""
@@ -24,23 +31,24 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         for appliance in appliances.values()
         if appliance["type"] == "EL_SMART_METER"
     ]
+    # skip devices that include in appliances
+    appliance_device_ids = {appliance["device"]["id"] for appliance in appliances.values()}
     for device in devices.values():
-        # skip devices that include in appliances
-        if device["id"] in [appliance["device"]["id"] for appliance in appliances.values()]:
+        if device["id"] in appliance_device_ids:
             continue
-        for sensor in device["newest_events"].keys():
-            if sensor == "te":
-                entities.append(NatureRemoTemperatureSensor(coordinator, device))
-            elif sensor == "hu":
-                entities.append(NatureRemoHumiditySensor(coordinator, device))
-            elif sensor == "il":
-                entities.append(NatureRemoIlluminanceSensor(coordinator, device))
+        entities.extend(
+            NatureRemoDeviceSensor(coordinator, device, sensor)
+            for sensor in device["newest_events"]
+            if sensor in SENSOR_TYPES
+        )
     async_add_entities(entities)
 
 
 class NatureRemoE(NatureRemoBase, SensorEntity):
     """Implementation of a Nature Remo E sensor."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator, appliance):
         super().__init__(coordinator, appliance)
         self._name = self._name.strip() + " Power"
@@ -48,14 +56,10 @@ class NatureRemoE(NatureRemoBase, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        appliance = self._coordinator.data["appliances"][self._appliance_id]
-        smart_meter = appliance["smart_meter"]
-        echonetlite_properties = smart_meter["echonetlite_properties"]
-        measured_instantaneous = next(
-            value["val"] for value in echonetlite_properties if value["epc"] == 231
-        )
-        _LOGGER.debug("Current state: %sW", measured_instantaneous)
-        return measured_instantaneous
+        epc_values = self._coordinator.data["epc_by_appliance"].get(self._appliance_id)
+        if epc_values is None:
+            return None
+        return epc_values.get(231)
 
     @property
     def unit_of_measurement(self):
@@ -81,68 +85,44 @@ class NatureRemoE(NatureRemoBase, SensorEntity):
         await self._coordinator.async_request_refresh()
 
 
-class NatureRemoTemperatureSensor(NatureRemoDeviceBase, SensorEntity):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Temperature"
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement of this entity, if any."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["te"]["val"]
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.TEMPERATURE
-
-
-class NatureRemoHumiditySensor(NatureRemoDeviceBase, SensorEntity):
+class NatureRemoDeviceSensor(NatureRemoDeviceBase, SensorEntity):
     """Implementation of a Nature Remo sensor."""
 
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Humidity"
-
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["hu"]["val"]
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        return SensorDeviceClass.HUMIDITY
-
-
-class NatureRemoIlluminanceSensor(NatureRemoDeviceBase, SensorEntity):
-    """Implementation of a Nature Remo sensor."""
-
-    def __init__(self, coordinator, appliance):
-        super().__init__(coordinator, appliance)
-        self._name = self._name.strip() + " Illuminance"
+    __slots__ = (
+        "_device_id",
+        "_event_key",
+        "_sensor_device_class",
+        "_unit",
+        "_unique_id",
+    )
+
+    def __init__(self, coordinator, device, event_key):
+        super().__init__(coordinator, device)
+        suffix, device_class, unit, unique_id_suffix = SENSOR_TYPES[event_key]
+        self._name = self._name.strip() + f" {suffix}"
+        self._device_id = device["id"]
+        self._event_key = event_key
+        self._sensor_device_class = device_class
+        self._unit = unit
+        self._unique_id = self._device_id + unique_id_suffix
 
     @property
     def unique_id(self):
         """Return a unique ID."""
-        return self._device["id"] + "-illuminance"
+        return self._unique_id
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement of this entity, if any."""
+        return self._unit
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        device = self._coordinator.data["devices"][self._device["id"]]
-        return device["newest_events"]["il"]["val"]
+        device = self._coordinator.data["devices"][self._device_id]
+        return device["newest_events"][self._event_key]["val"]
 
     @property
     def device_class(self):
         """Return the device class."""
-        return SensorDeviceClass.ILLUMINANCE 
+        return self._sensor_device_class